@@ -19,6 +19,11 @@ except:
     # Assume we are on v1 and give that a go
     from pydantic import BaseModel
     from pydantic.fields import Field
+try:
+    # orjson is optional, fall back to the stdlib json module if it's missing
+    import orjson
+except ImportError:
+    orjson = None
 
 class Long(int):
     ...
@@ -111,6 +116,16 @@ def field_to_mapping(info: Field):
         ) from exc
 
 
+def save_dict_as_json(data: dict, fname: Union[str, Path]):
+    """Write a log dict to disk, using orjson when it is available"""
+    if orjson is not None:
+        with open(fname, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(fname, "w") as f:
+            json.dump(data, f, indent=2, default=datetime.datetime.isoformat)
+
+
 def json_load_bytes(obj):
     if "__type__" in obj:
         if obj["__type__"] == "bytes":
@@ -263,10 +278,7 @@ class TTSMILog(ElasticModel):
     device_info: List[TTSMIDeviceLog]
 
     def save_as_json(self, fname: Union[str, Path]):
-        with open(fname, "w") as f:
-            raw_json = self.json(exclude_none=True)
-            reloaded_json = json.loads(raw_json)
-            json.dump(reloaded_json, f, indent=4)
+        save_dict_as_json(self.dict(exclude_none=True), fname)
 
 
 @optional
@@ -291,7 +303,4 @@ class TTSMIResetLog(ElasticModel):
     wh_mobo_reset: List[MoboReset]
 
     def save_as_json(self, fname: Union[str, Path]):
-        with open(fname, "w") as f:
-            raw_json = self.json(exclude_none=True)
-            reloaded_json = json.loads(raw_json)
-            json.dump(reloaded_json, f, indent=4)
+        save_dict_as_json(self.dict(exclude_none=True), fname)
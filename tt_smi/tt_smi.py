@@ -117,7 +117,7 @@ class TTSMI(App):
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
 
-        board_ids = [info["board_id"] for info in self.backend.device_infos]
+        board_ids = [state.info["board_id"] for state in self.backend.dev_state]
 
         yield TTHeader(self.app_name, self.app_version)
         with Container(id="app_grid"):
@@ -186,7 +186,7 @@ class TTSMI(App):
         for i, _ in enumerate(self.backend.devices):
             rows = [Text(f"{i}", style=self.theme["yellow_bold"], justify="center")]
             for fw in constants.FW_LIST:
-                val = self.backend.firmware_infos[i][fw]
+                val = self.backend.dev_state[i].firmware[fw]
                 if val == "N/A":
                     rows.append(
                         Text(f"{val}", style=self.theme["gray"], justify="center")
@@ -202,7 +202,7 @@ class TTSMI(App):
         """BH spefic telemetry rows - subject to change post qual"""
         bh_row = [Text(f"{board_num}", style=self.theme["yellow_bold"], justify="center")]
         for telem in constants.TELEM_LIST:
-            val = self.backend.device_telemetrys[board_num][telem]
+            val = self.backend.dev_state[board_num].telemetry[telem]
             bh_row.append(
                 Text(
                     f"{val}",
@@ -226,9 +226,9 @@ class TTSMI(App):
                 continue
             rows = [Text(f"{i}", style=self.theme["yellow_bold"], justify="center")]
             for telem in constants.TELEM_LIST:
-                val = self.backend.device_telemetrys[i][telem]
+                val = self.backend.dev_state[i].telemetry[telem]
                 if telem == "voltage":
-                    vdd_max = self.backend.chip_limits[i]["vdd_max"]
+                    vdd_max = self.backend.dev_state[i].limits["vdd_max"]
                     if float(val) < float(vdd_max):
                         rows.append(
                             Text(
@@ -256,7 +256,7 @@ class TTSMI(App):
                             )
                         )
                 elif telem == "current":
-                    max_current = self.backend.chip_limits[i]["tdc_limit"]
+                    max_current = self.backend.dev_state[i].limits["tdc_limit"]
                     if float(val) < float(max_current):
                         rows.append(
                             Text(
@@ -284,7 +284,7 @@ class TTSMI(App):
                             )
                         )
                 elif telem == "power":
-                    max_power = self.backend.chip_limits[i]["tdp_limit"]
+                    max_power = self.backend.dev_state[i].limits["tdp_limit"]
                     if float(val) < float(max_power):
                         rows.append(
                             Text(
@@ -312,7 +312,7 @@ class TTSMI(App):
                             )
                         )
                 elif telem == "aiclk":
-                    asic_fmax = self.backend.chip_limits[i]["asic_fmax"]
+                    asic_fmax = self.backend.dev_state[i].limits["asic_fmax"]
                     if float(val) < float(asic_fmax):
                         rows.append(
                             Text(
@@ -340,7 +340,7 @@ class TTSMI(App):
                             )
                         )
                 elif telem == "asic_temperature":
-                    max_temp = self.backend.chip_limits[i]["thm_limit"]
+                    max_temp = self.backend.dev_state[i].limits["thm_limit"]
                     if float(val) < float(max_temp):
                         rows.append(
                             Text(
@@ -380,7 +380,7 @@ class TTSMI(App):
         for i, device in enumerate(self.backend.devices):
             rows = [Text(f"{i}", style=self.theme["yellow_bold"], justify="center")]
             for info in constants.DEV_INFO_LIST:
-                val = self.backend.device_infos[i][info]
+                val = self.backend.dev_state[i].info[info]
                 if info == "board_type":
                     if val == "n300":
                         if device.is_remote():
@@ -418,7 +418,7 @@ class TTSMI(App):
                             )
                         )
                 elif info == "pcie_width":
-                    max_link_width = self.backend.pci_properties[i]["max_link_width"]
+                    max_link_width = self.backend.dev_state[i].pci["max_link_width"]
                     if device.is_remote():
                         rows.append(
                             Text(
@@ -455,7 +455,7 @@ class TTSMI(App):
                                 )
                             )
                 elif info == "pcie_speed":
-                    max_link_speed = self.backend.pci_properties[i]["max_link_speed"]
+                    max_link_speed = self.backend.dev_state[i].pci["max_link_speed"]
                     if device.is_remote():
                         rows.append(
                             Text(
@@ -570,6 +570,7 @@ class TTSMI(App):
         INTERRUPT_RECEIVED = True
         for thread in TELEM_THREADS:
             thread.join(timeout=0.1)
+        self.backend.close()
         self.exit(message=exit_message)
 
     def action_tab_one(self) -> None:
@@ -819,11 +820,15 @@ def main():
         )
         sys.exit(1)
     backend = TTSMIBackend(devices)
-    # Check firmware version before running tt_smi to avoid crashes
-    for i, device in enumerate(backend.devices):
-        check_fw_version(device, i)
-
-    tt_smi_main(backend, args)
+    try:
+        # Check firmware version before running tt_smi to avoid crashes
+        for i, device in enumerate(backend.devices):
+            check_fw_version(device, i)
+
+        tt_smi_main(backend, args)
+    finally:
+        # Covers the sys.exit paths in tt_smi_main as well as a normal return
+        backend.close()
 
 
 if __name__ == "__main__":
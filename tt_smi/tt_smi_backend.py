@@ -10,7 +10,6 @@ This is the backend of tt-smi.
 import os
 import re
 import sys
-import jsons
 import datetime
 from tt_smi import log
 from pathlib import Path
@@ -20,7 +19,8 @@ from rich.table import Table
 from tt_smi import constants
 from rich import get_console
 from typing import Dict, List
-from rich.progress import track
+from rich.progress import Progress
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from tt_tools_common.ui_common.themes import CMD_LINE_COLOR
 from tt_tools_common.reset_common.wh_reset import WHChipReset
 from tt_tools_common.reset_common.bh_reset import BHChipReset
@@ -34,12 +34,68 @@ from tt_tools_common.utils_common.tools_utils import (
     hex_to_semver_m3_fw,
     hex_to_date,
     hex_to_semver_eth,
-    init_logging,
     detect_chips_with_callback,
 )
 
 LOG_FOLDER = os.path.expanduser("~/tt_smi_logs/")
 
+# (SMBUS telemetry key, pyluwen telemetry struct attribute) pairs
+_SMBUS_FIELDS = tuple((key, key.lower()) for key in constants.SMBUS_TELEMETRY_LIST)
+# Copied for every telemetry read so unset fields default to None
+_EMPTY_TELEM = dict.fromkeys(constants.SMBUS_TELEMETRY_LIST)
+# First number in a raw sysfs attribute, e.g. b"2.5 GT/s PCIe" -> b"2.5"
+_LEADING_NUMBER = re.compile(rb"(\d+(?:\.\d+)?)")
+# PCIe link speed in GT/s -> PCIe generation
+_LINK_SPEED_TO_GEN = {32: 5, 16: 4, 8: 3, 5: 2, 2.5: 1}
+_LINK_SPEED_PROPERTIES = frozenset(("current_link_speed", "max_link_speed"))
+# DRAM speed encoded in the top byte of DDR_STATUS on WH/BH
+_DRAM_SPEED_TABLE = ("16G", "14G", "12G", "10G", "8G")
+# Chip limit -> (smbus telemetry key, shift, mask, format spec, divisor)
+_LIMIT_SPEC = {
+    "vdd_min": ("VDD_LIMITS", 0, 0xFFFF, "4.2f", 1000),
+    "vdd_max": ("VDD_LIMITS", 16, 0xFFFF, "4.2f", 1000),
+    "tdp_limit": ("TDP", 16, 0xFFFF, "3.0f", 1),
+    "tdc_limit": ("TDC", 16, 0xFFFF, "3.0f", 1),
+    "asic_fmax": ("AICLK", 16, 0xFFFF, "4.0f", 1),
+    "therm_trip_l1_limit": ("THM_LIMITS", 16, 0xFFFF, "2.0f", 1),
+    "thm_limit": ("THM_LIMITS", 0, 0xFFFF, "2.0f", 1),
+}
+# Firmware field -> (smbus telemetry key, converter for the raw value)
+_FW_SPEC = {
+    "fw_bundle_version": ("FW_BUNDLE_VERSION", hex_to_semver_m3_fw),
+    "tt_flash_version": ("TT_FLASH_VERSION", hex_to_semver_m3_fw),
+    "cm_fw": ("ARC0_FW_VERSION", hex_to_semver_m3_fw),
+    "cm_fw_date": ("WH_FW_DATE", lambda val: hex_to_date(val, include_time=False)),
+    "eth_fw": ("ETH_FW_VERSION", hex_to_semver_eth),
+    "bm_bl_fw": ("M3_BL_FW_VERSION", hex_to_semver_m3_fw),
+    "bm_app_fw": ("M3_APP_FW_VERSION", hex_to_semver_m3_fw),
+}
+# Chip cast method -> device name
+_DEVICE_NAMES = (("as_gs", "grayskull"), ("as_wh", "wormhole"), ("as_bh", "blackhole"))
+
+
+class DeviceState:
+    """All info and telemetry gathered for a single device"""
+
+    __slots__ = ("smbus_telem", "firmware", "pci", "info", "telemetry", "limits")
+
+    def __init__(
+        self,
+        smbus_telem: Dict = None,
+        firmware: Dict = None,
+        pci: Dict = None,
+        info: Dict = None,
+        telemetry: Dict = None,
+        limits: Dict = None,
+    ):
+        # Raw SMBUS telemetry values, hex formatted only when saving logs
+        self.smbus_telem = smbus_telem
+        self.firmware = firmware
+        self.pci = pci
+        self.info = info
+        self.telemetry = telemetry
+        self.limits = limits
+
 
 class TTSMIBackend:
     """
@@ -63,115 +119,118 @@ class TTSMIBackend:
                 for device in self.devices
             ],
         )
-        self.smbus_telem_info = []
-        self.firmware_infos = []
-        self.device_infos = []
-        self.device_telemetrys = []
-        self.chip_limits = []
-        self.pci_properties = []
+        self.dev_state: List[DeviceState] = [DeviceState() for _ in self.devices]
+        # sysfs paths and open attribute fds are cached so re-reading link state is cheap
+        self._pci_bus_paths = {}
+        self._pci_fd_cache = {}
+        # Devices are read independently, so one pool serves both the initial
+        # gather and every telemetry refresh. Released by close()
+        self._pool = None
 
         if fully_init:
-            for i, device in track(
-                enumerate(self.devices),
-                total=len(self.devices),
-                description="Gathering Information",
-                update_period=0.01,
-            ):
-                self.smbus_telem_info.append(self.get_smbus_board_info(i))
-                self.firmware_infos.append(self.get_firmware_versions(i))
-                self.pci_properties.append(self.get_pci_properties(i))
-                self.device_infos.append(self.get_device_info(i))
-                self.device_telemetrys.append(self.get_chip_telemetry(i))
-                self.chip_limits.append(self.get_chip_limits(i))
+            self._pool = ThreadPoolExecutor(
+                max_workers=max(1, min(32, len(self.devices)))
+            )
+            num_devices = len(self.devices)
+            # Redraw the progress bar at most ~20 times regardless of device count
+            update_every = max(1, num_devices // 20)
+            with Progress() as progress:
+                task = progress.add_task("Gathering Information", total=num_devices)
+                results = self._pool.map(self.gather_device_info, range(num_devices))
+                for done, _ in enumerate(results, start=1):
+                    if done % update_every == 0 or done == num_devices:
+                        progress.update(task, completed=done)
+
+    def gather_device_info(self, board_num: int) -> None:
+        """Read telemetry, firmware, pci and limit info for a single device"""
+        state = self.dev_state[board_num]
+        state.smbus_telem = self.get_smbus_board_info(board_num)
+        state.firmware = self.get_firmware_versions(board_num)
+        state.pci = self.get_pci_properties(board_num)
+        state.info = self.get_device_info(board_num)
+        state.telemetry = self.get_chip_telemetry(board_num)
+        state.limits = self.get_chip_limits(board_num)
 
     def get_device_name(self, device):
         """Get device name from chip object"""
-        if device.as_gs():
-            return "grayskull"
-        elif device.as_wh():
-            return "wormhole"
-        elif device.as_bh():
-            return "blackhole"
-        else:
-            assert False, "Unknown chip name, FIX!"
+        for cast, name in _DEVICE_NAMES:
+            if getattr(device, cast)():
+                return name
+        assert False, "Unknown chip name, FIX!"
 
     def save_logs(self, result_filename: str = None):
         """Save log for smi snapshots"""
-        time_now = datetime.datetime.now()
-        date_string = time_now.strftime("%m-%d-%Y_%H:%M:%S")
-        if not os.path.exists(LOG_FOLDER):
-            init_logging(LOG_FOLDER)
-        log_filename = f"{LOG_FOLDER}{date_string}_results.json"
         if result_filename:
             dir_path = os.path.dirname(os.path.realpath(result_filename))
             Path(dir_path).mkdir(parents=True, exist_ok=True)
             log_filename = result_filename
-        for i, device in enumerate(self.devices):
-            self.log.device_info[i].smbus_telem = self.smbus_telem_info[i]
-            self.log.device_info[i].board_info = self.device_infos[i]
-            # Add L/R for nb300 to separate local and remote asics
+        else:
+            os.makedirs(LOG_FOLDER, exist_ok=True)
+            date_string = datetime.datetime.now().strftime("%m-%d-%Y_%H:%M:%S")
+            log_filename = f"{LOG_FOLDER}{date_string}_results.json"
+        for device_log, device, state in zip(
+            self.log.device_info, self.devices, self.dev_state
+        ):
+            device_log.smbus_telem = {
+                key: hex(value) if value is not None else None
+                for key, value in state.smbus_telem.items()
+            }
+            device_log.board_info = state.info
+            # Add L/R for nb300 to separate local and remote asics. Copy the info
+            # so repeated snapshots don't keep appending to the live board type
             if device.as_wh():
-                board_type = self.device_infos[i]["board_type"]
                 suffix = " R" if device.is_remote() else " L"
-                board_type = board_type + suffix
-                self.log.device_info[i].board_info["board_type"] = board_type
-            self.log.device_info[i].telemetry = self.device_telemetrys[i]
-            self.log.device_info[i].firmwares = self.firmware_infos[i]
-            self.log.device_info[i].limits = self.chip_limits[i]
+                device_log.board_info = dict(
+                    state.info, board_type=state.info["board_type"] + suffix
+                )
+            device_log.telemetry = state.telemetry
+            device_log.firmwares = state.firmware
+            device_log.limits = state.limits
         self.log.save_as_json(log_filename)
         return log_filename
 
     def print_all_available_devices(self):
         """Print all available boards on host"""
+        # Query each chip once and share the rows between both tables
+        rows = []
+        for device, state in zip(self.devices, self.dev_state):
+            is_remote = device.is_remote()
+            board_type = state.info["board_type"]
+            resettable = not is_remote and board_type != "GALAXY"
+            # Add L/R for nb300 to separate local and remote asics
+            if device.as_wh():
+                board_type = board_type + (" R" if is_remote else " L")
+            rows.append(
+                (
+                    f"{device.get_pci_interface_id() if not is_remote else 'N/A'}",
+                    f"{self.get_device_name(device)}",
+                    f"{board_type}",
+                    f"{state.info['board_id']}",
+                    resettable,
+                )
+            )
+
         console = get_console()
         table_1 = Table(title="All available boards on host:")
         table_1.add_column("Pci Dev ID")
         table_1.add_column("Board Type")
         table_1.add_column("Device Series")
         table_1.add_column("Board Number")
-        for i, device in enumerate(self.devices):
-            board_id = self.device_infos[i]["board_id"]
-            board_type = self.device_infos[i]["board_type"]
-            pci_dev_id = (
-                device.get_pci_interface_id() if not device.is_remote() else "N/A"
-            )
-            if device.as_wh():
-                suffix = " R" if device.is_remote() else " L"
-                board_type = board_type + suffix
-
-            table_1.add_row(
-                f"{pci_dev_id}",
-                f"{self.get_device_name(device)}",
-                f"{board_type}",
-                f"{board_id}",
-            )
+        for *row, _ in rows:
+            table_1.add_row(*row)
         console.print(table_1)
         table_2 = Table(title="Boards that can be reset:")
         table_2.add_column("Pci Dev ID")
         table_2.add_column("Board Type")
         table_2.add_column("Device Series")
         table_2.add_column("Board Number")
-        for i, device in enumerate(self.devices):
-            if (
-                not device.is_remote()
-                and self.device_infos[i]["board_type"] != "GALAXY"
-            ):
-                board_id = self.device_infos[i]["board_id"]
-                board_type = self.device_infos[i]["board_type"]
-                pci_dev_id = device.get_pci_interface_id()
-                if device.as_wh():
-                    suffix = " R" if device.is_remote() else " L"
-                    board_type = board_type + suffix
-                table_2.add_row(
-                    f"{pci_dev_id}",
-                    f"{self.get_device_name(device)}",
-                    f"{board_type}",
-                    f"{board_id}",
-                )
+        for *row, resettable in rows:
+            if resettable:
+                table_2.add_row(*row)
         console.print(table_2)
 
     def get_smbus_board_info(self, board_num: int) -> Dict:
-        """Update board info by reading SMBUS_TELEMETRY"""
+        """Update board info by reading SMBUS_TELEMETRY. Values are raw ints, None if unset"""
         pylewen_chip = self.devices[board_num]
         if pylewen_chip.as_bh():
             telem_struct = pylewen_chip.as_bh().get_telemetry()
@@ -179,92 +238,131 @@ class TTSMIBackend:
             telem_struct = pylewen_chip.as_wh().get_telemetry()
         else:
             telem_struct = pylewen_chip.as_gs().get_telemetry()
-        json_map = jsons.dump(telem_struct)
-        smbus_telem_dict = dict.fromkeys(constants.SMBUS_TELEMETRY_LIST)
-
-        for key, value in json_map.items():
+        smbus_telem_dict = _EMPTY_TELEM.copy()
+        for key, attr in _SMBUS_FIELDS:
+            value = getattr(telem_struct, attr, 0)
             if value:
-                smbus_telem_dict[key.upper()] = hex(value)
+                smbus_telem_dict[key] = value
         return smbus_telem_dict
 
-    def update_telem(self):
-        """Update telemetry in a given interval"""
-        for i, _ in enumerate(self.devices):
-            self.smbus_telem_info[i] = self.get_smbus_board_info(i)
-            self.device_telemetrys[i] = self.get_chip_telemetry(i)
+    def update_telem(self, refresh_pci: bool = False):
+        """Update telemetry in a given interval. PCI link state is only re-read on request"""
+
+        def refresh_device(board_num: int) -> None:
+            state = self.dev_state[board_num]
+            state.smbus_telem = self.get_smbus_board_info(board_num)
+            state.telemetry = self.get_chip_telemetry(board_num)
+            if refresh_pci:
+                state.pci = self.get_pci_properties(board_num)
+                state.info["pcie_speed"] = state.pci["current_link_speed"]
+                state.info["pcie_width"] = state.pci["current_link_width"]
+
+        pool = self._pool
+        if pool is None:
+            return
+        try:
+            # map submits every refresh up front, so only submission can hit a
+            # pool shut down by close() or at interpreter exit
+            results = pool.map(refresh_device, range(len(self.devices)))
+        except RuntimeError:
+            return
+        try:
+            # Consume the results so any exception raised in a worker propagates
+            list(results)
+        except CancelledError:
+            # close() cancelled the refreshes still queued, nothing left to update
+            return
+
+    def close(self) -> None:
+        """Release the worker pool and cached sysfs fds. Running device reads are not waited on"""
+        for fds in self._pci_fd_cache.values():
+            for fd in fds.values():
+                os.close(fd)
+        self._pci_fd_cache.clear()
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if sys.version_info >= (3, 9):
+            pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            pool.shutdown(wait=False)
 
     def get_board_id(self, board_num) -> str:
         """Read board id from CSM or SPI if FW is not loaded"""
-        if self.smbus_telem_info[board_num]["BOARD_ID"]:
-            board_id = self.smbus_telem_info[board_num]["BOARD_ID"]
-            return (f"{board_id}").replace("0x", "")
+        telem = self.dev_state[board_num].smbus_telem
+        if telem["BOARD_ID"]:
+            board_id = telem["BOARD_ID"]
+            return f"{board_id:x}"
         else:
-            board_info_0 = self.smbus_telem_info[board_num]["BOARD_ID_LOW"]
-            board_info_1 = self.smbus_telem_info[board_num]["BOARD_ID_HIGH"]
+            board_info_0 = telem["BOARD_ID_LOW"]
+            board_info_1 = telem["BOARD_ID_HIGH"]
 
             if board_info_0 is None or board_info_1 is None:
                 return "N/A"
-            board_info_0 = (f"{board_info_0}").replace("0x", "")
-            board_info_1 = (f"{board_info_1}").replace("x", "")
-            return f"{board_info_1}{board_info_0}"
+            return f"0{board_info_1:x}{board_info_0:x}"
 
     def get_dram_speed(self, board_num) -> int:
         """Read DRAM Frequency from CSM and alternatively from SPI if FW not loaded on chip"""
-        if self.devices[board_num].as_gs():
-            val = int(self.smbus_telem_info[board_num]["DDR_SPEED"], 16)
+        telem = self.dev_state[board_num].smbus_telem
+        dev = self.devices[board_num]
+        if dev.as_gs():
+            val = telem["DDR_SPEED"]
             return f"{val}"
-        if self.smbus_telem_info[board_num]["DDR_STATUS"] is not None:
-            dram_speed_raw = (
-                int(self.smbus_telem_info[board_num]["DDR_STATUS"], 16) >> 24
-            )
-            if dram_speed_raw == 0:
-                return "16G"
-            elif dram_speed_raw == 1:
-                return "14G"
-            elif dram_speed_raw == 2:
-                return "12G"
-            elif dram_speed_raw == 3:
-                return "10G"
-            elif dram_speed_raw == 4:
-                return "8G"
-            else:
-                return None
+        if telem["DDR_STATUS"] is not None:
+            dram_speed_raw = telem["DDR_STATUS"] >> 24
+            if dram_speed_raw < len(_DRAM_SPEED_TABLE):
+                return _DRAM_SPEED_TABLE[dram_speed_raw]
+            return None
         return "N/A"
 
+    def get_pci_bus_path(self, board_num):
+        """Resolve the sysfs path of a device once. None if it can't be found"""
+        if board_num not in self._pci_bus_paths:
+            try:
+                pcie_bdf = self.devices[board_num].get_pci_bdf()
+                pci_bus_path = os.path.realpath(f"/sys/bus/pci/devices/{pcie_bdf}")
+            except:
+                pci_bus_path = None
+            self._pci_bus_paths[board_num] = pci_bus_path
+        return self._pci_bus_paths[board_num]
+
+    def read_pci_property(self, pci_bus_path: str, prop: str) -> bytes:
+        """Read a sysfs attribute, keeping its fd open so later reads are a single pread"""
+        fds = self._pci_fd_cache.setdefault(pci_bus_path, {})
+        if prop not in fds:
+            fds[prop] = os.open(os.path.join(pci_bus_path, prop), os.O_RDONLY)
+        try:
+            return os.pread(fds[prop], 64, 0)
+        except OSError:
+            # The device may have gone away (reset/rescan), reopen on the next read
+            fd = fds.pop(prop)
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            raise
+
     def get_pci_properties(self, board_num):
         """Get the PCI link speed and link width details from sysfs files"""
         if self.devices[board_num].is_remote():
             return {prop: "N/A" for prop in constants.PCI_PROPERTIES}
 
-        try:
-            pcie_bdf = self.devices[board_num].get_pci_bdf()
-            pci_bus_path = os.path.realpath(f"/sys/bus/pci/devices/{pcie_bdf}")
-        except:
+        pci_bus_path = self.get_pci_bus_path(board_num)
+        if pci_bus_path is None:
             return {prop: "N/A" for prop in constants.PCI_PROPERTIES}
 
-        def get_pcie_gen(link_speed: int) -> int:
-            if link_speed == 32:
-                return 5
-            if link_speed == 16:
-                return 4
-            elif link_speed == 8:
-                return 3
-            elif link_speed == 5:
-                return 2
-            elif link_speed == 2.5:
-                return 1
-            else:
-                assert False, f"Invalid link speed {link_speed}"
-
         properties = {}
 
         for prop in constants.PCI_PROPERTIES:
             try:
-                with open(os.path.join(pci_bus_path, prop), "r", encoding="utf-8") as f:
-                    output = f.readline().rstrip()
-                    value = int(re.findall(r"\d+", output)[0])
-                    if prop == "current_link_speed" or prop == "max_link_speed":
-                        value = get_pcie_gen(value)
+                output = self.read_pci_property(pci_bus_path, prop)
+                number = _LEADING_NUMBER.search(output).group(1)
+                if prop in _LINK_SPEED_PROPERTIES:
+                    # Speeds can be fractional (Gen1 is 2.5 GT/s). Unknown link
+                    # speeds raise KeyError and are reported as N/A
+                    value = _LINK_SPEED_TO_GEN[float(number)]
+                else:
+                    value = int(number)
             except Exception:
                 value = "N/A"
             properties[prop] = value
@@ -273,64 +371,67 @@ class TTSMIBackend:
     def get_dram_training_status(self, board_num) -> bool:
         """Get DRAM Training Status
         True means it passed training, False means it failed or did not train at all"""
-        if self.devices[board_num].as_wh():
-            num_channels = 8
-            for i in range(num_channels):
-                if self.smbus_telem_info[board_num]["DDR_STATUS"] is None:
-                    return False
-                dram_status = (
-                    int(self.smbus_telem_info[board_num]["DDR_STATUS"], 16) >> (4 * i)
-                ) & 0xF
-                if dram_status != 2:
-                    return False
-                return True
-        elif self.devices[board_num].as_gs():
-            num_channels = 6
-            for i in range(num_channels):
-                if self.smbus_telem_info[board_num]["DDR_STATUS"] is None:
-                    return False
-                dram_status = (
-                    int(self.smbus_telem_info[board_num]["DDR_STATUS"], 16) >> (4 * i)
-                ) & 0xF
-                if dram_status != 1:
-                    return False
-                return True
+        telem = self.dev_state[board_num].smbus_telem
+        dev = self.devices[board_num]
+        dram_status = telem["DDR_STATUS"]
+        if dev.as_wh():
+            # 6 channels, one nibble each, 2 == trained. Top byte holds the DRAM speed
+            return dram_status is not None and dram_status & 0xFFFFFF == 0x222222
+        elif dev.as_gs():
+            # 6 channels, one nibble each, 1 == trained
+            return dram_status is not None and dram_status & 0xFFFFFF == 0x111111
+
+    def get_bus_id(self, board_num) -> str:
+        """Get the pci bdf of a device. N/A for remote chips"""
+        try:
+            return self.devices[board_num].get_pci_bdf()
+        except:
+            return "N/A"
+
+    def get_device_board_type(self, board_num) -> str:
+        """Decode the board type from the board id"""
+        board_id = self.get_board_id(board_num)
+        if board_id == "N/A":
+            return "N/A"
+        # TODO: Update when we have BH type identifiers
+        if self.devices[board_num].as_bh():
+            return "bh"
+        return get_board_type(board_id)
+
+    def get_coords(self, board_num) -> str:
+        """Get the local (shelf, rack) coordinates of a WH chip"""
+        wh_chip = self.devices[board_num].as_wh()
+        if not wh_chip:
+            return "N/A"
+        coord = wh_chip.get_local_coord()
+        return f"({coord.shelf_x}, {coord.shelf_y}, {coord.rack_x}, {coord.rack_y})"
+
+    def get_pcie_speed(self, board_num):
+        """Current PCIe generation of the link"""
+        return self.dev_state[board_num].pci["current_link_speed"]
+
+    def get_pcie_width(self, board_num):
+        """Current PCIe link width"""
+        return self.dev_state[board_num].pci["current_link_width"]
+
+    # Device info field -> getter, called as getter(self, board_num)
+    DEV_INFO_DISPATCH = {
+        "bus_id": get_bus_id,
+        "board_type": get_device_board_type,
+        "board_id": get_board_id,
+        "coords": get_coords,
+        "dram_status": get_dram_training_status,
+        "dram_speed": get_dram_speed,
+        "pcie_speed": get_pcie_speed,
+        "pcie_width": get_pcie_width,
+    }
 
     def get_device_info(self, board_num) -> dict:
-        dev_info = {}
-        for field in constants.DEV_INFO_LIST:
-            if field == "bus_id":
-                try:
-                    dev_info[field] = self.devices[board_num].get_pci_bdf()
-                except:
-                    dev_info[field] = "N/A"
-            elif field == "board_type":
-                if self.get_board_id(board_num) == "N/A":
-                    dev_info[field] = "N/A"
-                # TODO: Update when we have BH type identifiers
-                elif self.devices[board_num].as_bh():
-                    dev_info[field] = "bh"
-                else:
-                    dev_info[field] = get_board_type(self.get_board_id(board_num))
-            elif field == "board_id":
-                dev_info[field] = self.get_board_id(board_num)
-            elif field == "coords":
-                if self.devices[board_num].as_wh():
-                    dev_info[
-                        field
-                    ] = f"({self.devices[board_num].as_wh().get_local_coord().shelf_x}, {self.devices[board_num].as_wh().get_local_coord().shelf_y}, {self.devices[board_num].as_wh().get_local_coord().rack_x}, {self.devices[board_num].as_wh().get_local_coord().rack_y})"
-                else:
-                    dev_info[field] = "N/A"
-            elif field == "dram_status":
-                dev_info[field] = self.get_dram_training_status(board_num)
-            elif field == "dram_speed":
-                dev_info[field] = self.get_dram_speed(board_num)
-            elif field == "pcie_speed":
-                dev_info[field] = self.pci_properties[board_num]["current_link_speed"]
-            elif field == "pcie_width":
-                dev_info[field] = self.pci_properties[board_num]["current_link_width"]
-
-        return dev_info
+        """Collect the device info fields shown in the info tab"""
+        return {
+            field: self.DEV_INFO_DISPATCH[field](self, board_num)
+            for field in constants.DEV_INFO_LIST
+        }
 
     def convert_signed_16_16_to_float(self, value):
         """Convert signed 16.16 to float"""
@@ -338,34 +439,19 @@ class TTSMIBackend:
 
     def get_bh_chip_telemetry(self, board_num) -> Dict:
         """Get telemetry data for bh chip. None if ARC FW not running"""
-        current = (
-            int(self.smbus_telem_info[board_num]["TDC"], 16) & 0xFFFF
-            if self.smbus_telem_info[board_num]["TDC"] is not None
-            else 0
-        )
-        if self.smbus_telem_info[board_num]["VCORE"] is not None:
-            voltage = int(self.smbus_telem_info[board_num]["VCORE"], 16) / 1000
+        telem = self.dev_state[board_num].smbus_telem
+        current = telem["TDC"] & 0xFFFF if telem["TDC"] is not None else 0
+        if telem["VCORE"] is not None:
+            voltage = telem["VCORE"] / 1000
         else:
             voltage = 10000
-        power = (
-            int(self.smbus_telem_info[board_num]["TDP"], 16) & 0xFFFF
-            if self.smbus_telem_info[board_num]["TDP"] is not None
-            else 0
-        )
+        power = telem["TDP"] & 0xFFFF if telem["TDP"] is not None else 0
         asic_temperature = (
-            (
-                self.convert_signed_16_16_to_float(
-                    int(self.smbus_telem_info[board_num]["ASIC_TEMPERATURE"], 16)
-                )
-            )
-            if self.smbus_telem_info[board_num]["ASIC_TEMPERATURE"] is not None
-            else 0
-        )
-        aiclk = (
-            int(self.smbus_telem_info[board_num]["AICLK"], 16) & 0xFFFF
-            if self.smbus_telem_info[board_num]["AICLK"] is not None
+            (self.convert_signed_16_16_to_float(telem["ASIC_TEMPERATURE"]))
+            if telem["ASIC_TEMPERATURE"] is not None
             else 0
         )
+        aiclk = telem["AICLK"] & 0xFFFF if telem["AICLK"] is not None else 0
 
         chip_telemetry = {
             "voltage": f"{voltage:4.2f}",
@@ -378,27 +464,17 @@ class TTSMIBackend:
 
     def get_wh_gs_chip_telemetry(self, board_num) -> Dict:
         """Get telemetry data for GS and WH chip. None if ARC FW not running"""
-        current = int(self.smbus_telem_info[board_num]["TDC"], 16) & 0xFFFF
-        if self.smbus_telem_info[board_num]["VCORE"] is not None:
-            voltage = int(self.smbus_telem_info[board_num]["VCORE"], 16) / 1000
-        else:
-            voltage = 10000
-        power = int(self.smbus_telem_info[board_num]["TDP"], 16) & 0xFFFF
-        asic_temperature = (
-            int(self.smbus_telem_info[board_num]["ASIC_TEMPERATURE"], 16) & 0xFFFF
-        ) / 16
-        aiclk = int(self.smbus_telem_info[board_num]["AICLK"], 16) & 0xFFFF
-
-        chip_telemetry = {
-            "voltage": f"{voltage:4.2f}",
-            "current": f"{current:5.1f}",
-            "power": f"{power:5.1f}",
-            "aiclk": f"{aiclk:4.0f}",
-            "asic_temperature": f"{asic_temperature:4.1f}",
+        telem = self.dev_state[board_num].smbus_telem
+        vcore = telem["VCORE"]
+        # Each field lives in the low 16 bits of its telemetry word
+        return {
+            "voltage": "%4.2f" % (vcore / 1000 if vcore is not None else 10000),
+            "current": "%5.1f" % (telem["TDC"] & 0xFFFF),
+            "power": "%5.1f" % (telem["TDP"] & 0xFFFF),
+            "aiclk": "%4.0f" % (telem["AICLK"] & 0xFFFF),
+            "asic_temperature": "%4.1f" % ((telem["ASIC_TEMPERATURE"] & 0xFFFF) / 16),
         }
 
-        return chip_telemetry
-
     def get_chip_telemetry(self, board_num) -> Dict:
         """Return the correct chip telemetry for a given board"""
         if self.devices[board_num].as_bh():
@@ -407,111 +483,28 @@ class TTSMIBackend:
             return self.get_wh_gs_chip_telemetry(board_num)
 
     def get_chip_limits(self, board_num):
-        """Get chip limits from the CSM. None if ARC FW not running"""
+        """Get chip limits from the CSM. 0 if ARC FW not running"""
+        telem = self.dev_state[board_num].smbus_telem
 
         chip_limits = {}
         for field in constants.LIMITS:
-            if field == "vdd_min":
-                value = (
-                    int(self.smbus_telem_info[board_num]["VDD_LIMITS"], 16) & 0xFFFF
-                    if self.smbus_telem_info[board_num]["VDD_LIMITS"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value/1000:4.2f}" if value is not None else None
-            elif field == "vdd_max":
-                value = (
-                    int(self.smbus_telem_info[board_num]["VDD_LIMITS"], 16) >> 16
-                    if self.smbus_telem_info[board_num]["VDD_LIMITS"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value/1000:4.2f}" if value is not None else None
-            elif field == "tdp_limit":
-                value = (
-                    int(self.smbus_telem_info[board_num]["TDP"], 16) >> 16
-                    if self.smbus_telem_info[board_num]["TDP"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value:3.0f}" if value is not None else None
-            elif field == "tdc_limit":
-                value = (
-                    int(self.smbus_telem_info[board_num]["TDC"], 16) >> 16
-                    if self.smbus_telem_info[board_num]["TDC"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value:3.0f}" if value is not None else None
-            elif field == "asic_fmax":
-                value = (
-                    int(self.smbus_telem_info[board_num]["AICLK"], 16) >> 16
-                    if self.smbus_telem_info[board_num]["AICLK"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value:4.0f}" if value is not None else None
-            elif field == "therm_trip_l1_limit":
-                value = (
-                    int(self.smbus_telem_info[board_num]["THM_LIMITS"], 16) >> 16
-                    if self.smbus_telem_info[board_num]["THM_LIMITS"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value:2.0f}" if value is not None else None
-            elif field == "thm_limit":
-                value = (
-                    int(self.smbus_telem_info[board_num]["THM_LIMITS"], 16) & 0xFFFF
-                    if self.smbus_telem_info[board_num]["THM_LIMITS"] is not None
-                    else 0
-                )
-                chip_limits[field] = f"{value:2.0f}" if value is not None else 0
-            else:
+            if field not in _LIMIT_SPEC:
                 chip_limits[field] = None
+                continue
+            key, shift, mask, fmt, divisor = _LIMIT_SPEC[field]
+            raw = telem[key]
+            value = ((raw >> shift) & mask) / divisor if raw is not None else 0
+            chip_limits[field] = format(value, fmt)
         return chip_limits
 
     def get_firmware_versions(self, board_num):
         """Translate the telem struct semver for gui"""
+        telem = self.dev_state[board_num].smbus_telem
         fw_versions = {}
         for field in constants.FW_LIST:
-            if field == "cm_fw":
-                val = self.smbus_telem_info[board_num]["ARC0_FW_VERSION"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_semver_m3_fw(int(val, 16))
-
-            elif field == "cm_fw_date":
-                val = self.smbus_telem_info[board_num]["WH_FW_DATE"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_date(int(val, 16), include_time=False)
-
-            elif field == "eth_fw":
-                val = self.smbus_telem_info[board_num]["ETH_FW_VERSION"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_semver_eth(int(val, 16))
-            elif field == "bm_bl_fw":
-                val = self.smbus_telem_info[board_num]["M3_BL_FW_VERSION"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_semver_m3_fw(int(val, 16))
-            elif field == "bm_app_fw":
-                val = self.smbus_telem_info[board_num]["M3_APP_FW_VERSION"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_semver_m3_fw(int(val, 16))
-            elif field == "tt_flash_version":
-                val = self.smbus_telem_info[board_num]["TT_FLASH_VERSION"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_semver_m3_fw(int(val, 16))
-            elif field == "fw_bundle_version":
-                val = self.smbus_telem_info[board_num]["FW_BUNDLE_VERSION"]
-                if val is None:
-                    fw_versions[field] = "N/A"
-                else:
-                    fw_versions[field] = hex_to_semver_m3_fw(int(val, 16))
+            key, convert = _FW_SPEC[field]
+            val = telem[key]
+            fw_versions[field] = "N/A" if val is None else convert(val)
         return fw_versions
 
     def gs_tensix_reset(self, board_num) -> None:
@@ -539,18 +532,18 @@ def pci_indices_from_json(json_dict):
     """Parse pci_list from reset json"""
     pci_indices = []
     reinit = False
-    if "gs_tensix_reset" in json_dict.keys():
+    if "gs_tensix_reset" in json_dict:
         pci_indices.extend(json_dict["gs_tensix_reset"]["pci_index"])
-    if "wh_link_reset" in json_dict.keys():
+    if "wh_link_reset" in json_dict:
         pci_indices.extend(json_dict["wh_link_reset"]["pci_index"])
-    if "re_init_devices" in json_dict.keys():
+    if "re_init_devices" in json_dict:
         reinit = json_dict["re_init_devices"]
     return pci_indices, reinit
 
 
 def mobo_reset_from_json(json_dict) -> dict:
     """Parse pci_list from reset json and init mobo reset"""
-    if "wh_mobo_reset" in json_dict.keys():
+    if "wh_mobo_reset" in json_dict:
         mobo_dict_list = []
         for mobo_dict in json_dict["wh_mobo_reset"]:
             # Only add the mobos that have a name
@@ -561,14 +554,13 @@ def mobo_reset_from_json(json_dict) -> dict:
             GalaxyReset().warm_reset_mobo(mobo_dict_list)
             # If there are mobos to reset, remove link reset pci index's from the json
             try:
-                wh_link_pci_indices = json_dict["wh_link_reset"]["pci_index"]
+                wh_link_pci_indices = set(json_dict["wh_link_reset"]["pci_index"])
                 for entry in mobo_dict_list:
-                    if "nb_host_pci_idx" in entry.keys() and entry["nb_host_pci_idx"]:
-                        # remove the list of WH pcie index's from the reset list
-                        wh_link_pci_indices = list(
-                            set(wh_link_pci_indices) - set(entry["nb_host_pci_idx"])
-                        )
-                json_dict["wh_link_reset"]["pci_index"] = wh_link_pci_indices
+                    # remove the list of WH pcie index's from the reset list
+                    wh_link_pci_indices.difference_update(
+                        entry.get("nb_host_pci_idx") or ()
+                    )
+                json_dict["wh_link_reset"]["pci_index"] = list(wh_link_pci_indices)
             except Exception as e:
                 print(
                     CMD_LINE_COLOR.RED,
@@ -585,7 +577,8 @@ def pci_board_reset(list_of_boards: List[int], reinit=False):
     reset_wh_pci_idx = []
     reset_gs_devs = []
     reset_bh_pci_idx = []
-    for pci_idx in list_of_boards:
+    # Probe each pci index once, even if it was listed more than once
+    for pci_idx in dict.fromkeys(list_of_boards):
         try:
             chip = PciChip(pci_interface=pci_idx)
         except Exception as e: